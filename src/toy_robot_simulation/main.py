@@ -1,9 +1,13 @@
+import codecs
+import os
 import sys
+from typing import Iterator, List
 
 from .controller import Command, Controller
 from .robot import Direction, Location, Robot, Table
 
 TABLE = Table(5, 5)
+READ_CHUNK_SIZE = 64 * 1024
 
 
 def execute_command(controller: Controller, command: str) -> None:
@@ -28,11 +32,42 @@ def execute_command(controller: Controller, command: str) -> None:
         pass
 
 
+def read_command_batches(fd: int, encoding: str = "utf-8") -> Iterator[List[str]]:
+    """Reads commands from a file descriptor in large chunks and yields them in batches.
+
+    Each read drains whatever is currently available on the descriptor (up to
+    READ_CHUNK_SIZE bytes), so a fast writer is consumed with few syscalls. Complete lines
+    are yielded together as one batch; a trailing partial line is held until the rest of it
+    arrives, or yielded on its own once the descriptor reaches end of file.
+
+    Args:
+        fd (int): The file descriptor to read commands from.
+        encoding (str): The text encoding of the incoming commands.
+
+    Yields:
+        List[str]: The command lines read by a single chunk.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    while True:
+        chunk = os.read(fd, READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        if lines:
+            yield lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield [pending]
+
+
 def main():
     """The main entry point of the script.
 
     If command-line arguments are provided, it reads commands from the files specified.
-    Otherwise, it enters an interactive mode where commands can be input manually.
+    Otherwise, it enters an interactive mode where commands can be input manually. When stdin
+    is not a terminal (e.g. commands are piped in), the interactive mode reads commands in
+    batches instead of line by line.
     """
     robot = Robot()
     controller = Controller(robot)
@@ -46,8 +81,14 @@ def main():
     else:
         # Interactive mode
         try:
-            while True:
-                execute_command(controller, input())
+            if sys.stdin.isatty():
+                while True:
+                    execute_command(controller, input())
+            else:
+                encoding = sys.stdin.encoding or "utf-8"
+                for batch in read_command_batches(sys.stdin.fileno(), encoding):
+                    for line in batch:
+                        execute_command(controller, line)
         except KeyboardInterrupt:
             # Exit on Ctrl+C
             pass
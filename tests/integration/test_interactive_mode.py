@@ -1,3 +1,5 @@
+import os
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -23,7 +25,40 @@ class TestInteractiveMode:
         mocked_input = MagicMock()
         mocked_input.side_effect = commands + [KeyboardInterrupt]
 
-        with patch("builtins.print", mocked_print), patch("builtins.input", mocked_input):
+        with (
+            patch("builtins.print", mocked_print),
+            patch("builtins.input", mocked_input),
+            patch.object(sys, "argv", ["main.py"]),
+            patch.object(sys, "stdin", MagicMock(isatty=MagicMock(return_value=True))),
+        ):
+            main()
+
+        if expected_output:
+            mocked_print.assert_called_with(expected_output)
+        else:
+            mocked_print.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "commands, expected_output",
+        [
+            [["PLACE 0,0,NORTH", "REPORT"], "Output: 0,0,NORTH"],
+            [["PLACE 0,0,NORTH", "MOVE", "REPORT"], "Output: 0,1,NORTH"],
+            [["PLACE 1,2,EAST", "MOVE", "MOVE", "LEFT", "MOVE", "REPORT"], "Output: 3,3,NORTH"],
+            [["LEFT", "MOVE", "REPORT"], ""],
+        ],
+    )
+    def test_interactive_mode_with_piped_stdin(self, commands, expected_output):
+        mocked_print = MagicMock()
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, "\n".join(commands).encode())
+        os.close(write_fd)
+
+        with (
+            open(read_fd) as stdin,
+            patch("builtins.print", mocked_print),
+            patch.object(sys, "argv", ["main.py"]),
+            patch.object(sys, "stdin", stdin),
+        ):
             main()
 
         if expected_output:
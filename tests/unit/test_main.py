@@ -1,10 +1,11 @@
+import os
 import sys
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from toy_robot_simulation.controller import Command, Controller
-from toy_robot_simulation.main import TABLE, execute_command, main
+from toy_robot_simulation.main import TABLE, execute_command, main, read_command_batches
 from toy_robot_simulation.robot import Direction, Location
 
 
@@ -86,8 +87,53 @@ class TestMain:
     ):
         mocked_input = MagicMock()
 
-        with patch("builtins.input", mocked_input), patch.object(sys, "argv", ["main.py"]):
+        with (
+            patch("builtins.input", mocked_input),
+            patch.object(sys, "argv", ["main.py"]),
+            patch.object(sys, "stdin", MagicMock(isatty=MagicMock(return_value=True))),
+        ):
             mocked_input.side_effect = KeyboardInterrupt
             main()
 
         mocked_input.assert_called()
+
+    def test_main_runs_pipelined_interactive_mode_if_stdin_is_not_a_tty(self):
+        mocked_input = MagicMock()
+        mocked_batches = MagicMock(return_value=iter([["PLACE 0,0,NORTH", "REPORT"]]))
+
+        with (
+            patch("builtins.input", mocked_input),
+            patch("toy_robot_simulation.main.read_command_batches", mocked_batches),
+            patch("toy_robot_simulation.main.execute_command") as mocked_execute,
+            patch.object(sys, "argv", ["main.py"]),
+            patch.object(sys, "stdin", MagicMock(isatty=MagicMock(return_value=False))),
+        ):
+            main()
+
+        mocked_input.assert_not_called()
+        assert [call.args[1] for call in mocked_execute.call_args_list] == [
+            "PLACE 0,0,NORTH",
+            "REPORT",
+        ]
+
+    @pytest.mark.parametrize(
+        "chunks, batches",
+        [
+            [[b"MOVE\nLEFT\n"], [["MOVE", "LEFT"]]],
+            [[b"MOVE\nLE", b"FT\nREPORT"], [["MOVE"], ["LEFT"], ["REPORT"]]],
+            [[b"PLACE 0,0,", b"NORTH\n"], [["PLACE 0,0,NORTH"]]],
+            [[b""], []],
+        ],
+    )
+    def test_read_command_batches_yields_complete_lines_per_chunk(self, chunks, batches):
+        with patch("os.read", MagicMock(side_effect=chunks + [b""])):
+            assert list(read_command_batches(0)) == batches
+
+    def test_read_command_batches_reads_from_pipe(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"PLACE 0,0,NORTH\nMOVE\nREPORT\n")
+        os.close(write_fd)
+        try:
+            assert list(read_command_batches(read_fd)) == [["PLACE 0,0,NORTH", "MOVE", "REPORT"]]
+        finally:
+            os.close(read_fd)